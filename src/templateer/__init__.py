@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from .core import TemplateMixin
 from .core import TemplateModel
 from .generator import autogen_models
 from .settings import settings
 
 __version__ = "0.1.0"
-__all__ = ["TemplateModel", "autogen_models", "settings"]
+__all__ = [
+    "TemplateMixin",
+    "TemplateModel",
+    "autogen_models",
+    "settings",
+]
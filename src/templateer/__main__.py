@@ -0,0 +1,37 @@
+"""``python -m templateer`` command-line shim."""
+
+from __future__ import annotations
+
+import argparse
+
+from .cli import generate
+from .generator import autogen_models
+
+
+def main() -> None:
+    """Parse legacy ``--autogen``/``--generate`` flags."""
+    p = argparse.ArgumentParser(
+        description="Templateer – self‑generating template toolkit"
+    )
+    p.add_argument(
+        "--autogen",
+        action="store_true",
+        help="Only generate model stubs, don’t render templates.",
+    )
+    p.add_argument(
+        "--generate",
+        action="store_true",
+        help="Generate stubs *and* render each template once.",
+    )
+    args = p.parse_args()
+
+    if args.autogen:
+        autogen_models(verbose=True)
+    elif args.generate:
+        generate.main(args=["--verbose"], standalone_mode=False)
+    else:
+        p.print_help()
+
+
+if __name__ == "__main__":
+    main()
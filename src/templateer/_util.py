@@ -0,0 +1,94 @@
+"""Internal filesystem helpers."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+
+def _ensure_on_path(p: Path | str) -> None:
+    """Prepend ``p`` to ``sys.path`` unless it is already there."""
+    s = str(p)
+    if s not in sys.path:
+        sys.path.insert(0, s)
+
+
+def sha256_hex(data: bytes) -> str:
+    """Hex SHA-256 digest of ``data``."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path: Path) -> str | None:
+    """Hex SHA-256 digest of a file, or ``None`` if it can't be read."""
+    try:
+        return sha256_hex(path.read_bytes())
+    except OSError:
+        return None
+
+
+def load_json_cache(path: Path) -> dict[str, Any]:
+    """Read a JSON cache file, treating a missing or corrupt one as empty."""
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_json_cache(path: Path, data: dict[str, Any]) -> None:
+    """Persist a JSON cache file if its contents changed."""
+    payload = json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+    write_files([(path, payload)], skip_unchanged=True)
+
+
+def _unchanged(path: Path, data: bytes) -> bool:
+    """Check whether ``path`` already holds exactly ``data``."""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def write_files(
+    items: Iterable[tuple[Path, bytes]],
+    skip_unchanged: bool = False,
+    sync: bool = False,
+) -> list[Path]:
+    """Write ``(path, data)`` pairs in one pass, grouped by directory.
+
+    With ``skip_unchanged`` set, files whose contents already match are left
+    untouched. With ``sync`` set, a single ``os.sync()`` is issued after the
+    whole batch rather than one fsync per file. Returns the paths that were
+    actually written.
+    """
+    written: list[Path] = []
+    last_parent: Path | None = None
+
+    for path, data in sorted(items, key=lambda item: (str(item[0].parent), item[0].name)):
+        if skip_unchanged and _unchanged(path, data):
+            continue
+
+        if path.parent != last_parent:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            last_parent = path.parent
+
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        written.append(path)
+
+    if sync and written and hasattr(os, "sync"):
+        os.sync()
+
+    return written
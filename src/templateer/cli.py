@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import importlib
-import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import click
 
-from .core import TemplateModel
+from ._util import _ensure_on_path
+from ._util import file_digest
+from ._util import sha256_hex
+from ._util import write_files
+from .core import is_template_class
 from .generator import autogen_models
+from .generator import generator
 from .settings import settings
 
 
@@ -30,43 +36,139 @@ def autogen(verbose: bool) -> None:
         click.echo(f"Generated {len(generated)} model stubs")
 
 
+# Below this many stubs, process start-up costs more than it saves
+_PARALLEL_THRESHOLD = 4
+
+# Stubs handed to a pool worker per task
+_CHUNKSIZE = 4
+
+
+def _init_worker(project_root: str) -> None:
+    """Make generated model packages importable in a pool worker."""
+    _ensure_on_path(project_root)
+
+
+def _render_stub(stub: Path) -> tuple[str, Path | None, str]:
+    """Render the template model defined in one stub module.
+
+    Returns ``(stem, output_path, code)``; on failure ``output_path`` is
+    ``None`` and the last item holds the error message instead.
+    """
+    mod_name = f"templateer.models.{stub.stem}"
+    
+    try:
+        mod = importlib.import_module(mod_name)
+        tmpl_cls = next(
+            c for c in mod.__dict__.values() if is_template_class(c)
+        )
+        
+        instance = tmpl_cls()
+        return stub.stem, instance._output_path, instance.generate(write=False)
+    except Exception as exc:
+        return stub.stem, None, str(exc)
+
+
+def _render_settings() -> dict[str, str | bool]:
+    """Settings that change rendered output without touching the stub."""
+    return {
+        "output_dir": str(settings.template_output_dir.resolve()),
+        "debug": settings.debug,
+    }
+
+
+def _is_up_to_date(entry: dict, stub: Path) -> bool:
+    """Check whether a cached render of ``stub`` is still current.
+
+    The stub, the rendered file and the render settings must all match what
+    was recorded when the output was last written.
+    """
+    output = entry.get("output")
+    return bool(
+        output
+        and all(entry.get(k) == v for k, v in _render_settings().items())
+        and entry.get("stub") == file_digest(stub)
+        and entry.get("out") == file_digest(Path(output))
+    )
+
+
+def _record_render(entry: dict, stub: Path, output_path: Path, data: bytes) -> None:
+    """Store what a fresh render of ``stub`` depended on and produced."""
+    entry.update(
+        _render_settings(),
+        stub=file_digest(stub),
+        output=str(output_path.resolve()),
+        out=sha256_hex(data),
+    )
+
+
 @main.command()
 @click.option("--verbose", "-v", is_flag=True, help="Show verbose output")
-def generate(verbose: bool) -> None:
+@click.option("--sync", is_flag=True, help="Flush written files to disk once at the end")
+def generate(verbose: bool, sync: bool) -> None:
     """Generate stubs and render templates."""
     generated = autogen_models(verbose=verbose)
     
     if verbose:
         click.echo(f"Generated {len(generated)} model stubs")
     
-    sys.path.insert(0, str(settings.project_root))
-    
-    rendered_count = 0
-    for stub in settings.model_dir.glob("*_model.py"):
-        mod_name = f"templateer.models.{stub.stem}"
+    project_root = str(settings.project_root)
+    _init_worker(project_root)
+    # Stubs may have just been written; refresh finder caches once up front
+    importlib.invalidate_caches()
+    cache = generator.load_cache()
+    stubs: list[Path] = []
+    stub_paths = [
+        p for p in settings.model_dir.iterdir() if p.name.endswith("_model.py")
+    ]
+    for stub in stub_paths:
+        entry = cache.get(f"{stub.stem.removesuffix('_model')}.py", {})
         
-        try:
-            mod = importlib.import_module(mod_name)
-            tmpl_cls = next(
-                c for c in mod.__dict__.values()
-                if (isinstance(c, type) 
-                    and issubclass(c, TemplateModel) 
-                    and c is not TemplateModel)
-            )
-            
-            instance = tmpl_cls()
-            instance.generate()
-            rendered_count += 1
-            
+        # Skip when neither the stub, the render settings nor the output changed
+        if _is_up_to_date(entry, stub):
             if verbose:
-                rel_path = instance._output_path.relative_to(
-                    settings.project_root
-                )
-                click.echo(f"[templateer] rendered → {rel_path}")
-                
-        except Exception as exc:
+                click.echo(f"[templateer] unchanged → {stub.stem}")
+            continue
+        stubs.append(stub)
+    
+    if len(stubs) < _PARALLEL_THRESHOLD:
+        results = list(map(_render_stub, stubs))
+    else:
+        # One worker per chunk at most; fork start-up isn't free
+        max_workers = min(os.cpu_count() or 1, -(-len(stubs) // _CHUNKSIZE))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(project_root,),
+        ) as ex:
+            results = list(ex.map(_render_stub, stubs, chunksize=_CHUNKSIZE))
+    
+    rendered_count = 0
+    pending: dict[Path, bytes] = {}
+    for stem, output_path, text in results:
+        if output_path is None:
             if verbose:
-                click.echo(f"⚠️  {stub.stem} could not render: {exc}")
+                click.echo(f"⚠️  {stem} could not render: {text}")
+            continue
+        
+        data = text.encode("utf-8")
+        pending[output_path] = data
+        rendered_count += 1
+        
+        stub = settings.model_dir / f"{stem}.py"
+        key = f"{stem.removesuffix('_model')}.py"
+        if key in cache:
+            _record_render(cache[key], stub, output_path, data)
+        
+        if verbose:
+            try:
+                rel_path = output_path.relative_to(settings.project_root)
+            except ValueError:
+                rel_path = output_path
+            click.echo(f"[templateer] rendered → {rel_path}")
+    
+    # Only touch outputs whose rendered content actually changed
+    write_files(pending.items(), skip_unchanged=True, sync=sync)
+    generator.save_cache(cache)
     
     if not verbose:
         click.echo(f"Rendered {rendered_count} templates")
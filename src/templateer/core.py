@@ -1,28 +1,91 @@
-"""Core TemplateModel class."""
+"""Core TemplateModel classes."""
 
 from __future__ import annotations
 
+import sys
+from dataclasses import fields
+from dataclasses import is_dataclass
+from functools import cache
+from importlib import import_module
 from pathlib import Path
+from typing import Any
 
+from jinja2 import BaseLoader
+from jinja2 import ChoiceLoader
 from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
 from jinja2 import FileSystemLoader
 from jinja2 import StrictUndefined
+from jinja2 import Template
+from jinja2 import TemplateNotFound
+from jinja2 import Undefined
+from jinja2 import nodes
 from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import PrivateAttr
 
+from ._util import write_files
 from .settings import settings
 
 
+@cache
+def _cached_import(module_name: str, item_name: str):
+    """Return ``module_name.item_name``, importing the module only if needed."""
+    modules = sys.modules
+    mod = modules.get(module_name)
+    spec = getattr(mod, "__spec__", None)
+    if mod is None or (spec is not None and getattr(spec, "_initializing", False)):
+        import_module(module_name)
+        mod = modules[module_name]
+    return getattr(mod, item_name)
+
+
+class ModuleConstantLoader(BaseLoader):
+    """Load templates stored as string constants in Python modules.
+
+    Template names are dotted paths such as ``"example_function_template.TEMPLATE"``.
+    Sources come from already imported modules, so a template is never
+    reloaded: like ``_COMPILED``, it is cached for the lifetime of the process.
+    """
+
+    def get_source(self, environment: Environment, template: str):
+        module_path, _, var_name = template.rpartition(".")
+        if not module_path:
+            raise TemplateNotFound(template)
+
+        try:
+            source = _cached_import(module_path, var_name)
+        except (ImportError, AttributeError) as exc:
+            raise TemplateNotFound(template) from exc
+
+        if not isinstance(source, str):
+            raise TemplateNotFound(template)
+
+        filename = getattr(sys.modules[module_path], "__file__", None)
+        return source, filename, None
+
+
 class JinjaEnvironment:
     """Jinja environment factory."""
     
     def __init__(self) -> None:
         project_root = settings.project_root
         template_root = project_root / ".templateer"
+        cache_dir = project_root / ".jinja_cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
         
         self.env = Environment(
-            loader=FileSystemLoader(str(template_root)),
+            loader=ChoiceLoader([
+                FileSystemLoader(str(template_root)),
+                ModuleConstantLoader(),
+            ]),
+            bytecode_cache=FileSystemBytecodeCache(directory=str(cache_dir)),
             autoescape=False,
-            undefined=StrictUndefined,
+            # Strict lookups only when debugging; generated code has no untrusted input
+            undefined=StrictUndefined if settings.debug else Undefined,
+            finalize=None,
+            extensions=(),
+            optimized=True,
             trim_blocks=True,
             lstrip_blocks=True,
         )
@@ -31,13 +94,75 @@ class JinjaEnvironment:
         """Create template from string."""
         return self.env.from_string(template_str)
 
+    def from_ast(
+        self,
+        ast: nodes.Template,
+        source: str,
+        name: str | None = None,
+        filename: str | None = None,
+    ) -> Template:
+        """Compile template from an already parsed AST.
+
+        ``source`` is only used to key the bytecode cache, so a cached entry
+        skips code generation exactly as ``get_template`` would.
+        """
+        bcc = self.env.bytecode_cache
+        bucket = None
+        code = None
+        if bcc is not None and name is not None:
+            bucket = bcc.get_bucket(self.env, name, filename, source)
+            code = bucket.code
+
+        if code is None:
+            code = self.env.compile(ast, name=name, filename=filename)
+            if bucket is not None:
+                bucket.code = code
+                bcc.set_bucket(bucket)
+
+        return self.env.template_class.from_code(
+            self.env, code, self.env.make_globals(None)
+        )
+
+    def get_template(self, name: str) -> Template:
+        """Load template by file name or dotted module constant path."""
+        return self.env.get_template(name)
 
-# Global environment instance
-jinja_env = JinjaEnvironment()
 
+@cache
+def get_jinja_env() -> JinjaEnvironment:
+    """Get or create the shared Jinja environment on first use."""
+    return JinjaEnvironment()
 
-class TemplateModel(BaseModel):
-    """Base class binding arbitrary data to a Jinja template string."""
+
+def __getattr__(name: str) -> Any:
+    # ``jinja_env`` is built lazily so importing TemplateModel stays cheap
+    if name == "jinja_env":
+        return get_jinja_env()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Compiled templates keyed by ``__template__`` dotted path, kept for the process lifetime
+_COMPILED: dict[str, Template] = {}
+
+
+def _to_dict(obj: Any) -> dict[str, Any]:
+    """Get the Jinja render context for a pydantic model or dataclass."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="python", exclude_defaults=False)
+    if is_dataclass(obj):
+        # Shallow on purpose: Jinja reads nested values by attribute or key
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"cannot render {type(obj).__name__!r}: not a model or dataclass")
+
+
+class TemplateMixin:
+    """Template lookup, rendering and output shared by all template classes.
+
+    Combine with ``@dataclass(slots=True, frozen=True)`` for lightweight data
+    bags, or use :class:`TemplateModel` when pydantic validation is wanted.
+    """
+
+    __slots__ = ()
 
     __template__: str
     __output__: str | None = None
@@ -46,13 +171,17 @@ class TemplateModel(BaseModel):
     def _template_str(self) -> str:
         """Get template string from module."""
         module_path, _, var_name = self.__template__.rpartition(".")
-        mod = __import__(module_path, fromlist=[var_name])
-        return getattr(mod, var_name)
+        return _cached_import(module_path, var_name)
 
     @property
-    def _jinja_template(self):
-        """Get compiled Jinja template."""
-        return jinja_env.from_string(self._template_str)
+    def _jinja_template(self) -> Template:
+        """Get compiled Jinja template, compiling it on first use."""
+        template = _COMPILED.get(self.__template__)
+        if template is None:
+            template = _COMPILED[self.__template__] = get_jinja_env().get_template(
+                self.__template__
+            )
+        return template
 
     @property
     def _output_path(self) -> Path:
@@ -67,14 +196,51 @@ class TemplateModel(BaseModel):
 
     def render(self) -> str:
         """Render template with model data."""
-        return self._jinja_template.render(**self.model_dump())
+        return self._jinja_template.render(**_to_dict(self))
 
     def generate(self, write: bool = True) -> str:
         """Generate code and optionally write to file."""
         code = self.render()
         
         if write:
-            self._output_path.parent.mkdir(parents=True, exist_ok=True)
-            self._output_path.write_text(code, encoding="utf-8")
+            write_files([(self._output_path, code.encode("utf-8"))])
         
         return code
+
+
+class TemplateModel(TemplateMixin, BaseModel):
+    """Base class binding arbitrary data to a Jinja template string."""
+
+    # Build the pydantic-core schema on first use, not at class creation
+    model_config = ConfigDict(defer_build=True)
+
+    _dumped: dict[str, Any] | None = PrivateAttr(default=None)
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False):
+        """Copy the model without carrying over the memoized render context."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied._dumped = None
+        return copied
+
+    def render(self) -> str:
+        """Render template with model data.
+
+        The render context is memoized only for ``frozen`` models; mutable
+        models can change in place (e.g. ``items.append``) and are re-dumped.
+        """
+        if not self.model_config.get("frozen"):
+            return self._jinja_template.render(**_to_dict(self))
+
+        data = self._dumped
+        if data is None:
+            data = self._dumped = _to_dict(self)
+        return self._jinja_template.render(**data)
+
+
+def is_template_class(obj: Any) -> bool:
+    """Check whether ``obj`` is a concrete template class."""
+    return (
+        isinstance(obj, type)
+        and issubclass(obj, TemplateMixin)
+        and obj not in (TemplateMixin, TemplateModel)
+    )
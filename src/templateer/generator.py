@@ -2,41 +2,232 @@
 
 from __future__ import annotations
 
+import importlib.util
 import re
-import runpy
 import sys
-import textwrap
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
+from types import CodeType
 from types import ModuleType
-from typing import Iterable
 
 from jinja2 import meta
+from jinja2 import nodes
 
-from .core import jinja_env
+from ._util import _ensure_on_path
+from ._util import file_digest
+from ._util import load_json_cache
+from ._util import save_json_cache
+from ._util import sha256_hex
+from ._util import write_files
+from .core import _COMPILED
+from .core import get_jinja_env
 from .settings import settings
 
 
+_SEPARATOR_RE = re.compile(r"[_\-]")
+
+_STUB_TEMPLATE = (
+    "from __future__ import annotations\n"
+    "\n"
+    "from typing import Any\n"
+    "\n"
+    "from pydantic import ConfigDict\n"
+    "\n"
+    "from templateer import TemplateModel\n"
+    "\n"
+    "\n"
+    "class {cls}(TemplateModel):\n"
+    '    """Auto-generated from .templateer/{stem}.py"""\n'
+    '    __template__ = "{mod}.{attr}"\n'
+    "    model_config = ConfigDict(defer_build=True)\n"
+    "\n"
+    "{fields}\n"
+)
+
+_DATACLASS_STUB_TEMPLATE = (
+    "from __future__ import annotations\n"
+    "\n"
+    "from dataclasses import dataclass\n"
+    "from typing import Any\n"
+    "\n"
+    "from templateer import TemplateMixin\n"
+    "\n"
+    "\n"
+    "@dataclass(slots=True, frozen=True)\n"
+    "class {cls}(TemplateMixin):\n"
+    '    """Auto-generated from .templateer/{stem}.py"""\n'
+    '    __template__ = "{mod}.{attr}"\n'
+    "\n"
+    "{fields}\n"
+)
+
+_STUB_TEMPLATES = {
+    "dataclass": _DATACLASS_STUB_TEMPLATE,
+    "pydantic": _STUB_TEMPLATE,
+}
+
+
+# Loaded stub modules keyed by path, with the file mtime they were loaded at
+_MOD_CACHE: dict[Path, tuple[int, ModuleType]] = {}
+
+
+@lru_cache(maxsize=256)
+def _compile_source(source: bytes, filename: str) -> CodeType:
+    """Compile Python source, reusing code objects for identical input."""
+    return compile(source, filename, "exec")
+
+
+def load_stub_module(stub: Path) -> ModuleType:
+    """Load a generated stub module, reusing it while the file is unchanged."""
+    mtime = stub.stat().st_mtime_ns
+    cached = _MOD_CACHE.get(stub)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    spec = importlib.util.spec_from_file_location(stub.stem, stub)
+    mod = importlib.util.module_from_spec(spec)
+    # dataclasses and pydantic resolve annotations through sys.modules
+    sys.modules[stub.stem] = mod
+    try:
+        exec(_compile_source(stub.read_bytes(), str(stub)), mod.__dict__)
+    except BaseException:
+        sys.modules.pop(stub.stem, None)
+        raise
+    _MOD_CACHE[stub] = (mtime, mod)
+    return mod
+
+
+@lru_cache(maxsize=256)
+def _camelify(name: str) -> str:
+    """Convert snake_or-kebab → CamelCase."""
+    if "_" not in name and "-" not in name:
+        return name[:1].upper() + name[1:]
+    return "".join(p[:1].upper() + p[1:] for p in _SEPARATOR_RE.split(name) if p)
+
+
+@lru_cache(maxsize=256)
+def _field_block(vars_: tuple[str, ...]) -> str:
+    """Render stub field declarations for a sorted tuple of variable names."""
+    return "\n".join(map("    {}: Any | None = None".format, vars_)) or "    pass"
+
+
 class ModelGenerator:
-    """Generates Pydantic model stubs from template modules."""
+    """Generates dataclass or Pydantic model stubs from template modules."""
 
     def __init__(self) -> None:
         self.project_root = settings.project_root
         self.template_root = self.project_root / ".templateer"
-        self.camel_re = re.compile(r"[_\-]([a-zA-Z])")
+        self.cache_path = self.template_root / ".cache.json"
+        self._failed_imports: set[Path] = set()
 
     def camelify(self, name: str) -> str:
         """Convert snake_or-kebab → CamelCase."""
-        name = self.camel_re.sub(lambda m: m.group(1).upper(), name)
-        return name[:1].upper() + name[1:]
+        return _camelify(name)
+
+    def load_cache(self) -> dict[str, dict[str, str]]:
+        """Load content hashes recorded by previous runs.
+
+        Entries are keyed by template file name and hold the ``src`` and
+        ``stub`` digests. Once the template has rendered they also hold the
+        ``output`` path and its ``out`` digest, plus the ``output_dir`` and
+        ``debug`` settings that render used.
+        """
+        return load_json_cache(self.cache_path)
+
+    def save_cache(self, cache: dict[str, dict[str, str]]) -> None:
+        """Persist content hashes for the next run."""
+        save_json_cache(self.cache_path, cache)
 
     def discover_template_modules(self) -> Iterable[Path]:
-        """Find all Python files in template root."""
-        return self.template_root.glob("*.py")
+        """Find all public Python files in template root."""
+        if not self.template_root.is_dir():
+            return ()
+        return (
+            p for p in self.template_root.iterdir()
+            if p.suffix == ".py" and not p.name.startswith("_")
+        )
+
+    def load_template_module(self, tpl_py: Path) -> ModuleType | None:
+        """Import a template module once, remembering modules that fail."""
+        if tpl_py in self._failed_imports:
+            return None
+
+        mod_name = tpl_py.stem
+        mod = sys.modules.get(mod_name)
+        if mod is not None:
+            mod_file = getattr(mod, "__file__", None)
+            if mod_file is not None and Path(mod_file).resolve() == tpl_py.resolve():
+                return mod
+            # e.g. .templateer/enum.py would otherwise resolve to stdlib enum
+            self._failed_imports.add(tpl_py)
+            raise ImportError(
+                f"module name {mod_name!r} is already taken by "
+                f"{mod_file or 'a built-in module'}; rename the template"
+            )
+
+        try:
+            spec = importlib.util.spec_from_file_location(mod_name, tpl_py)
+            mod = importlib.util.module_from_spec(spec)
+            sys.modules[mod_name] = mod
+            spec.loader.exec_module(mod)
+        except Exception:
+            sys.modules.pop(mod_name, None)
+            self._failed_imports.add(tpl_py)
+            raise
+
+        return mod
 
-    def extract_template_vars(self, template_str: str) -> set[str]:
-        """Extract undeclared variables from Jinja template."""
-        ast = jinja_env.env.parse(template_str)
-        return meta.find_undeclared_variables(ast)
+    def parse_template(
+        self,
+        template_str: str,
+        name: str | None = None,
+        filename: str | None = None,
+    ) -> nodes.Template:
+        """Parse Jinja template source into an AST."""
+        return get_jinja_env().env.parse(template_str, name=name, filename=filename)
+
+    def extract_template_vars(
+        self, template: str | nodes.Template
+    ) -> set[str]:
+        """Extract undeclared variables from Jinja template or its AST."""
+        if isinstance(template, str):
+            template = self.parse_template(template)
+        return meta.find_undeclared_variables(template)
+
+    def model_path_for(self, module: ModuleType | Path) -> Path:
+        """Get stub path for a template module or its source file."""
+        if isinstance(module, Path):
+            stem = module.stem
+        else:
+            stem = module.__name__.split(".")[-1]
+        return settings.model_dir / f"{stem}_model.py"
+
+    def build_model_stub(
+        self,
+        module: ModuleType,
+        template_attr: str,
+        vars_: set[str],
+        style: str | None = None,
+    ) -> str:
+        """Build model stub source.
+
+        ``style`` is ``"dataclass"`` or ``"pydantic"`` and defaults to
+        ``settings.stub_style``.
+        """
+        stem = module.__name__.split(".")[-1]
+        class_name = f"{self.camelify(stem)}Template"
+
+        field_lines = _field_block(tuple(sorted(vars_)))
+
+        stub = _STUB_TEMPLATES[style or settings.stub_style].format(
+            cls=class_name,
+            stem=stem,
+            mod=module.__name__,
+            attr=template_attr,
+            fields=field_lines,
+        )
+        return stub
 
     def write_model_stub(
         self, 
@@ -45,50 +236,80 @@ class ModelGenerator:
         vars_: set[str]
     ) -> Path:
         """Write Pydantic model stub to file."""
-        stem = module.__name__.split(".")[-1]
-        class_name = f"{self.camelify(stem)}Template"
-        model_path = settings.model_dir / f"{stem}_model.py"
+        model_path = self.model_path_for(module)
         
         if model_path.exists():
             return model_path  # Don't overwrite user edits
 
-        field_lines = "\n".join(
-            f"    {v}: Any | None = None" for v in sorted(vars_)
-        ) or "    pass"
-
-        stub = textwrap.dedent(
-            f"""\
-            from __future__ import annotations
-
-            from typing import Any
-
-            from templateer import TemplateModel
-
-
-            class {class_name}(TemplateModel):
-                \"\"\"Auto-generated from .templateer/{stem}.py\"\"\"
-                __template__ = \"{module.__name__}.{template_attr}\"
-
-            {field_lines}
-            """
-        )
-        
-        model_path.write_text(stub, encoding="utf-8")
+        stub = self.build_model_stub(module, template_attr, vars_)
+        write_files([(model_path, stub.encode("utf-8"))])
         return model_path
 
     def autogen_models(self, verbose: bool = False) -> list[Path]:
-        """Generate missing Pydantic stubs for every TEMPLATE."""
+        """Generate missing model stubs for every TEMPLATE."""
+        if not self.template_root.is_dir():
+            return []  # No templates, and nothing worth caching
+        
         generated: list[Path] = []
-        sys.path.insert(0, str(self.template_root))
+        pending: list[tuple[Path, bytes]] = []
+        cache = self.load_cache()
+        _ensure_on_path(self.template_root)
         
         for tpl_py in self.discover_template_modules():
-            mod = runpy.run_path(tpl_py)["__loader__"].load_module()
+            src_hash = sha256_hex(tpl_py.read_bytes())
+            entry = cache.get(tpl_py.name)
+            model_path = self.model_path_for(tpl_py)
+            
+            # Unchanged source with its stub in place: skip import and parse
+            if entry and entry.get("src") == src_hash and model_path.exists():
+                if verbose:
+                    rel_path = model_path.relative_to(self.project_root)
+                    print(f"[templateer] model stub → {rel_path}")
+                generated.append(model_path)
+                continue
             
-            if not hasattr(mod, "TEMPLATE"):
+            try:
+                mod = self.load_template_module(tpl_py)
+            except Exception as exc:
+                print(
+                    f"⚠️  {tpl_py.name} could not be imported: {exc}",
+                    file=sys.stderr,
+                )
+                continue
+            
+            if mod is None or not hasattr(mod, "TEMPLATE"):
+                cache.pop(tpl_py.name, None)
                 continue
                 
-            vars_ = self.extract_template_vars(mod.TEMPLATE)
-            model_path = self.write_model_stub(mod, "TEMPLATE", vars_)
+            if model_path.exists():  # Don't overwrite user edits
+                stub_hash = file_digest(model_path)
+            else:
+                dotted = f"{mod.__name__}.TEMPLATE"
+                filename = getattr(mod, "__file__", None)
+                try:
+                    ast = self.parse_template(
+                        mod.TEMPLATE, name=dotted, filename=filename
+                    )
+                    vars_ = self.extract_template_vars(ast)
+                    # Reuse the parse so render() never compiles this template again
+                    if dotted not in _COMPILED:
+                        _COMPILED[dotted] = get_jinja_env().from_ast(
+                            ast, mod.TEMPLATE, name=dotted, filename=filename
+                        )
+                except Exception as exc:
+                    # One broken template must not lose every other stub
+                    cache.pop(tpl_py.name, None)
+                    print(
+                        f"⚠️  {tpl_py.name} could not be parsed: {exc}",
+                        file=sys.stderr,
+                    )
+                    continue
+                stub = self.build_model_stub(mod, "TEMPLATE", vars_).encode("utf-8")
+                stub_hash = sha256_hex(stub)
+                pending.append((model_path, stub))
+            
+            # New source invalidates any recorded render output
+            cache[tpl_py.name] = {"src": src_hash, "stub": stub_hash}
             
             if verbose:
                 rel_path = model_path.relative_to(self.project_root)
@@ -96,6 +317,8 @@ class ModelGenerator:
                 
             generated.append(model_path)
         
+        write_files(pending)
+        self.save_cache(cache)
         return generated
 
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
 from confidantic import PluginRegistry
 from confidantic import Settings
@@ -25,9 +27,25 @@ class TemplateerSettings(Settings):
         description="Directory for files produced by generate().",
     )
 
+    stub_style: Literal["dataclass", "pydantic"] = Field(
+        default="dataclass",
+        alias="STUB_STYLE",
+        description="Base for generated stubs; 'pydantic' opts into validation.",
+    )
+
+    debug: bool = Field(
+        default=False,
+        alias="TEMPLATEER_DEBUG",
+        description="Fail on undefined template variables (StrictUndefined).",
+    )
 
+
+@lru_cache(maxsize=1)
 def get_settings() -> TemplateerSettings:
-    """Get or create settings singleton."""
+    """Get or create settings singleton.
+
+    Call ``get_settings.cache_clear()`` first to re-read the environment.
+    """
     PluginRegistry.register(TemplateerSettings)
     settings = init_settings(PluginRegistry.build_class())
     
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import importlib
 import importlib.util
 import os
-import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
-from .core import TemplateModel
+from ._util import _ensure_on_path
+from .core import is_template_class
 from .generator import autogen_models
+from .generator import generator
+from .generator import load_stub_module
 from .settings import get_settings
 
 if TYPE_CHECKING:
@@ -23,12 +26,20 @@ if TYPE_CHECKING:
         pass
 
 
+# Probe without importing so tree-sitter only loads when the test runs
+_HAS_TREE_SITTER = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("tree_sitter_languages", "pydantree")
+)
+
+
 class TemplateTestHelper:
     """Helper for testing template generation."""
     
     def __init__(self, temp_dir: Path) -> None:
         self.temp_dir = temp_dir
         self.settings = None
+        self._saved_cache_path: Path | None = None
     
     def setup_test_environment(self) -> None:
         """Set up temporary testing directories."""
@@ -39,28 +50,33 @@ class TemplateTestHelper:
         os.environ["TEMPLATE_OUTPUT_DIR"] = str(temp_output)
         
         # Force settings reload
+        get_settings.cache_clear()
         self.settings = get_settings()
         
+        # Keep the content-hash cache out of the real workspace
+        self._saved_cache_path = generator.cache_path
+        generator.cache_path = self.temp_dir / ".cache.json"
+        
         # Generate stubs and instantiate templates
         autogen_models()
         self._instantiate_all_templates()
     
+    def teardown_test_environment(self) -> None:
+        """Point the generator back at the workspace cache."""
+        if self._saved_cache_path is not None:
+            generator.cache_path = self._saved_cache_path
+            self._saved_cache_path = None
+    
     def _instantiate_all_templates(self) -> None:
         """Load and instantiate all template models."""
-        sys.path.insert(0, str(self.settings.model_dir))
+        _ensure_on_path(self.settings.model_dir)
+        importlib.invalidate_caches()
         
         for stub in self.settings.model_dir.glob("*_model.py"):
-            spec = importlib.util.spec_from_file_location(
-                stub.stem, stub
-            )
-            mod = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(mod)
+            mod = load_stub_module(stub)
             
             tmpl_cls = next(
-                c for c in mod.__dict__.values()
-                if (isinstance(c, type) 
-                    and issubclass(c, TemplateModel) 
-                    and c is not TemplateModel)
+                c for c in mod.__dict__.values() if is_template_class(c)
             )
             
             # Generate output files
@@ -74,16 +90,17 @@ def template_test_helper(tmp_path_factory):
     helper = TemplateTestHelper(temp_dir)
     helper.setup_test_environment()
     yield helper
+    helper.teardown_test_environment()
 
 
+@pytest.mark.skipif(
+    not _HAS_TREE_SITTER, reason="tree-sitter dependencies not available"
+)
 def test_generated_syntax(template_test_helper):
     """Test that generated Python files have valid syntax."""
-    try:
-        from pydantree import Parser
-        from pydantree import ParsedDocument
-        from tree_sitter_languages import get_language
-    except ImportError:
-        pytest.skip("tree-sitter dependencies not available")
+    from pydantree import Parser
+    from pydantree import ParsedDocument
+    from tree_sitter_languages import get_language
     
     py_language = get_language("python")
     ts_parser = Parser(py_language)
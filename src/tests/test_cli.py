@@ -0,0 +1,50 @@
+"""Tests for the generate command's render cache."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from templateer import cli
+
+
+def _rendered(tmp_path, monkeypatch, output_dir, debug=False):
+    """Record a render of one stub into ``output_dir`` and return its entry."""
+    monkeypatch.setattr(
+        cli, "settings", SimpleNamespace(template_output_dir=output_dir, debug=debug)
+    )
+    stub = tmp_path / "foo_model.py"
+    stub.write_text("x = 1\n")
+    output_dir.mkdir(exist_ok=True)
+    output = output_dir / "foo.py"
+    output.write_bytes(b"code\n")
+
+    entry: dict = {}
+    cli._record_render(entry, stub, output, b"code\n")
+    return entry, stub
+
+
+def test_unchanged_render_is_skipped(tmp_path, monkeypatch):
+    entry, stub = _rendered(tmp_path, monkeypatch, tmp_path / "out")
+    assert cli._is_up_to_date(entry, stub)
+
+
+def test_output_dir_change_forces_rerender(tmp_path, monkeypatch):
+    entry, stub = _rendered(tmp_path, monkeypatch, tmp_path / "out")
+    monkeypatch.setattr(
+        cli, "settings", SimpleNamespace(template_output_dir=tmp_path / "new", debug=False)
+    )
+    assert not cli._is_up_to_date(entry, stub)
+
+
+def test_debug_change_forces_rerender(tmp_path, monkeypatch):
+    entry, stub = _rendered(tmp_path, monkeypatch, tmp_path / "out")
+    monkeypatch.setattr(
+        cli, "settings", SimpleNamespace(template_output_dir=tmp_path / "out", debug=True)
+    )
+    assert not cli._is_up_to_date(entry, stub)
+
+
+def test_stub_edit_forces_rerender(tmp_path, monkeypatch):
+    entry, stub = _rendered(tmp_path, monkeypatch, tmp_path / "out")
+    stub.write_text("x = 2\n")
+    assert not cli._is_up_to_date(entry, stub)
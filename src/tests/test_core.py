@@ -0,0 +1,56 @@
+"""Tests for TemplateModel rendering."""
+
+from __future__ import annotations
+
+import sys
+from types import ModuleType
+
+import pytest
+from pydantic import ConfigDict
+
+from templateer import TemplateModel
+
+
+class ItemsTemplate(TemplateModel):
+    __template__ = "t4_tpl.TEMPLATE"
+
+    items: list[str] = []
+
+
+class FrozenItemsTemplate(ItemsTemplate):
+    model_config = ConfigDict(frozen=True)
+
+
+@pytest.fixture(autouse=True)
+def _template_module(monkeypatch):
+    tpl = ModuleType("t4_tpl")
+    tpl.TEMPLATE = "{{ items|join(',') }}"
+    monkeypatch.setitem(sys.modules, "t4_tpl", tpl)
+
+
+def test_reassignment_rerenders():
+    m = ItemsTemplate(items=["a"])
+    assert m.render() == "a"
+    m.items = ["b"]
+    assert m.render() == "b"
+
+
+def test_in_place_mutation_rerenders():
+    m = ItemsTemplate(items=["a"])
+    assert m.render() == "a"
+    m.items.append("b")
+    assert m.render() == "a,b"
+
+
+def test_model_copy_update_rerenders():
+    m = FrozenItemsTemplate(items=["a"])
+    assert m.render() == "a"
+    m2 = m.model_copy(update={"items": ["b"]})
+    assert m2.render() == "b"
+    assert m.render() == "a"
+
+
+def test_frozen_model_memoizes_context():
+    m = FrozenItemsTemplate(items=["a"])
+    assert m.render() == "a"
+    assert m._dumped == {"items": ["a"]}
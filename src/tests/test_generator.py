@@ -0,0 +1,40 @@
+"""Tests for generated model stubs."""
+
+from __future__ import annotations
+
+import sys
+from types import ModuleType
+
+import pytest
+
+from templateer.core import is_template_class
+from templateer.generator import ModelGenerator
+from templateer.generator import generator
+from templateer.generator import load_stub_module
+
+
+@pytest.mark.parametrize("style", ["dataclass", "pydantic"])
+def test_generated_stub_loads_and_renders(tmp_path, monkeypatch, style):
+    tpl = ModuleType("t1_tpl")
+    tpl.TEMPLATE = "{{ greeting }}, {{ name }}!"
+    monkeypatch.setitem(sys.modules, "t1_tpl", tpl)
+
+    vars_ = generator.extract_template_vars(tpl.TEMPLATE)
+    stub = tmp_path / "t1_tpl_model.py"
+    stub.write_text(generator.build_model_stub(tpl, "TEMPLATE", vars_, style=style))
+
+    mod = load_stub_module(stub)
+    assert load_stub_module(stub) is mod
+
+    tmpl_cls = next(c for c in mod.__dict__.values() if is_template_class(c))
+    assert tmpl_cls(greeting="Hi", name="Ada").render() == "Hi, Ada!"
+
+
+def test_project_without_templates(tmp_path):
+    gen = ModelGenerator()
+    gen.template_root = tmp_path / ".templateer"
+    gen.cache_path = gen.template_root / ".cache.json"
+
+    assert list(gen.discover_template_modules()) == []
+    assert gen.autogen_models() == []
+    assert not gen.template_root.exists()